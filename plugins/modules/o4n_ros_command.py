@@ -45,10 +45,57 @@ options:
         required: false
         type: int
         default: 10
+    device_type:
+        description:
+            - Netmiko device type used for SSH sessions.
+            - The default C(autodetect) maps to netmiko's generic terminal server driver, which fits the Ruggedcom ROS menu
+              and CLI. Netmiko has no Ruggedcom ROS specific driver.
+        required: false
+        type: str
+        default: autodetect
+    global_delay_factor:
+        description:
+            - Netmiko global_delay_factor for SSH sessions. Values below 1 shorten netmiko's waits while the connection
+              is set up on fast links.
+            - Command reads are bounded by their own read timeout and are not affected by this factor.
+            - Too low a value on slow or congested links can make the connection setup fail.
+        required: false
+        type: float
+        default: 1.0
+    last_read:
+        description:
+            - Seconds to wait for more data after the last read, for SSH sends that are timed rather than prompt driven
+              (the CLI prompt prelude sent when a session is opened).
+            - Too low a value on slow or congested links can truncate the output.
+        required: false
+        type: float
+        default: 1.0
+    reuse_connection:
+        description:
+            - Keep the authenticated session in a process-local pool, keyed by host, port, user, protocol, device_type
+              and password, for later calls of main() in the same Python process.
+            - Every Ansible task runs the module in a new process, so a pooled session is never reused across tasks.
+              The pool only helps when the module is imported and run repeatedly by a long-lived Python process.
+            - Pooled sessions are closed after C(CONNECTION_POOL_IDLE_TIMEOUT) seconds idle
+              (default 300) or C(CONNECTION_POOL_MAX_AGE) seconds of age (default 3600),
+              both read from the environment, and always when the process exits.
+        required: false
+        type: bool
+        default: false
+    use_asyncio:
+        description:
+            - Run the session with asyncio, using asyncssh for SSH and telnetlib3 for Telnet.
+            - Falls back to the netmiko/telnetlib implementation when the library for the selected
+              protocol is not installed. Pooled connections are not used on this path.
+        required: false
+        type: bool
+        default: false
 
 requirements:
     - netmiko
     - telnetlib
+    - asyncssh (optional, for use_asyncio with SSH)
+    - telnetlib3 (optional, for use_asyncio with Telnet)
 
 author:
     - Marcos Schonfeld (@marcosmas28)
@@ -72,7 +119,10 @@ EXAMPLES = r'''
 RETURN = r'''
 # These are examples of possible return values, and in general should use other names for return values.
 content:
-    description: the commands output as a string.
+    description:
+        - the commands output as a string.
+        - Over SSH each command's output follows a C(>command) header line, without the echoed command and the
+          trailing device prompt. Pages split by the C(--More--) pager are joined back together.
     type: str
     returned: always
     sample: "\
@@ -87,11 +137,277 @@ content:
 
 # Python Modules
 from ansible.module_utils.basic import AnsibleModule
-from netmiko import ConnectHandler, NetmikoTimeoutException
+from netmiko import ConnectHandler
 import telnetlib
+import threading
+import atexit
+import hashlib
+import asyncio
+import select
 import time
+import os
+import re
 import logging
 
+try:
+    import asyncssh
+    HAS_ASYNCSSH = True
+except ImportError:
+    HAS_ASYNCSSH = False
+
+try:
+    import telnetlib3
+    HAS_TELNETLIB3 = True
+except ImportError:
+    HAS_TELNETLIB3 = False
+
+
+# Prevent Paramiko logs, once per process
+logging.getLogger("paramiko").setLevel(logging.CRITICAL + 1)
+logging.getLogger("paramiko.transport").propagate = False
+
+# Device prompts
+_MORE_PATTERN = r'--More-- or \(q\)uit'
+_MORE_RE = re.compile(_MORE_PATTERN)
+_PROMPT_RE = re.compile(rb'> {4}')
+_ASYNC_CLI_RE = re.compile(rb'>\s*$')
+_ANSI_RE = re.compile(rb'\x1b\[[0-9;?]*[A-Za-z]')
+_LINEFEED_RE = re.compile(rb'\r\r\r\n|\r\r\n|\r\n|\n\r|\r')
+_ASYNC_USER_RE = re.compile(rb'Enter User Name: ')
+_ASYNC_PASSWORD_RE = re.compile(rb'Password: ')
+_ASYNC_TELNET_RE = re.compile(rb'(?P<login>Enter User Name:)|> {4}')
+
+
+# Connection pool, keyed by (host, port, user, protocol, device_type, password digest)
+CONNECTION_POOL_MAX_AGE = int(os.environ.get("CONNECTION_POOL_MAX_AGE", 3600))
+CONNECTION_POOL_IDLE_TIMEOUT = int(os.environ.get("CONNECTION_POOL_IDLE_TIMEOUT", 300))
+_POOL = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _pool_key(params):
+    # the password is only kept as a digest, so a session opened with other credentials is never handed out
+    password_digest = hashlib.sha256(params.get("password").encode()).hexdigest()
+    return (params.get("host"), params.get("port"), params.get("user"), params.get("protocol"),
+            params.get("device_type"), password_digest)
+
+
+def _close(conn, protocol):
+    try:
+        if protocol == "telnet":
+            conn.close()
+        else:
+            conn.disconnect()
+    except Exception:
+        pass
+
+
+def _is_alive(conn, protocol):
+    try:
+        if protocol == "telnet":
+            conn.sock.getpeername()
+            # a session logged out for inactivity still has a peer, but raises EOFError once drained
+            while conn.read_very_eager():
+                pass
+        else:
+            conn.find_prompt()
+    except Exception:
+        return False
+    return True
+
+
+def maybe_reap():
+    """Close pooled connections older than the max age or idle longer than the idle timeout."""
+    now = time.time()
+    with _POOL_LOCK:
+        for key, (conn, created_at, last_used) in list(_POOL.items()):
+            if now - created_at > CONNECTION_POOL_MAX_AGE or now - last_used > CONNECTION_POOL_IDLE_TIMEOUT:
+                del _POOL[key]
+                _close(conn, key[3])
+
+
+def _close_pool():
+    """Log out of every pooled session, so none is left open on the device when the process exits."""
+    with _POOL_LOCK:
+        entries = list(_POOL.items())
+        _POOL.clear()
+    for key, (conn, created_at, last_used) in entries:
+        _close(conn, key[3])
+
+
+atexit.register(_close_pool)
+
+
+def get_connection(params):
+    """Check out a live pooled connection.
+
+    Returns a (connection, created_at) tuple. The connection is None when a new session must be
+    opened, either because reuse is disabled, the pool is empty or the pooled session died.
+    """
+    key = _pool_key(params)
+    if params.get("reuse_connection"):
+        maybe_reap()
+        with _POOL_LOCK:
+            entry = _POOL.pop(key, None)
+        if entry is not None:
+            conn, created_at, last_used = entry
+            if _is_alive(conn, key[3]):
+                return conn, created_at
+            _close(conn, key[3])
+    return None, time.time()
+
+
+def release(params, conn, created_at):
+    """Return a connection to the pool, or close it when reuse is disabled."""
+    key = _pool_key(params)
+    if not params.get("reuse_connection"):
+        _close(conn, key[3])
+        return
+    with _POOL_LOCK:
+        previous = _POOL.pop(key, None)
+        _POOL[key] = (conn, created_at, time.time())
+    if previous is not None:
+        _close(previous[0], key[3])
+
+
+def read_until_re(tn_client, pattern, timeout):
+    """Read from the telnet session until pattern matches the received data.
+
+    As with telnetlib's read_until, the data up to the end of the match is returned, the rest is kept
+    for the next read, and whatever was received is returned when the timeout expires.
+    The bytearray is returned as is, callers decode it once without an intermediate bytes copy.
+    """
+    buf = bytearray()
+    deadline = time.time() + timeout
+    while True:
+        try:
+            chunk = tn_client.read_very_eager()
+        except EOFError:
+            if buf:
+                break
+            raise
+        if chunk:
+            buf.extend(chunk)
+            # only the new chunk, plus some overlap with the previous one, can hold a new match
+            match = pattern.search(buf, max(0, len(buf) - len(chunk) - 256))
+            if match:
+                end = match.end()
+                # telnetlib keeps processed data in the undocumented cookedq attribute, and every read_* method
+                # (read_until, read_very_eager, ...) serves it first. Putting the bytes after the match back there
+                # leaves them for the next read, as read_until does. telnetlib is gone in Python 3.13, so this only
+                # has to hold for the telnetlib versions that exist.
+                tn_client.cookedq = bytes(buf[end:]) + tn_client.cookedq
+                del buf[end:]
+                break
+        # a device that keeps talking without ever printing the pattern must not outlive the timeout
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        if not chunk:
+            select.select([tn_client], [], [], remaining)
+    return buf
+
+
+def _wait_prompt(tn_client, timeout):
+    """Read from the telnet session until the prompt followed by the finish keyword is echoed."""
+    return read_until_re(tn_client, _PROMPT_RE, timeout)
+
+
+async def _read_until_async(reader, pattern, timeout):
+    """Read raw bytes from an asyncio stream until pattern matches.
+
+    Returns the received bytearray and the match, which is None when the stream closed first.
+    """
+    buf = bytearray()
+    while True:
+        chunk = await asyncio.wait_for(reader.read(65536), timeout)
+        if not chunk:
+            return buf, None
+        buf.extend(chunk)
+        match = pattern.search(buf, max(0, len(buf) - len(chunk) - 256))
+        if match:
+            return buf, match
+
+
+async def _drain_async(reader, quiet, timeout):
+    """Discard data until the stream stays quiet for quiet seconds, as netmiko's last_read does.
+
+    Gives up after timeout seconds so a device that never stops talking cannot hang the task.
+    """
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            chunk = await asyncio.wait_for(reader.read(65536), quiet)
+        except asyncio.TimeoutError:
+            return
+        if not chunk:
+            return
+
+
+async def _run_ssh(params):
+    """Run the commands over a single asyncssh session and return their output."""
+    output = bytearray()
+    async with asyncssh.connect(params.get("host"), port=params.get("port"), username=params.get("user"),
+                                password=params.get("password"), known_hosts=None, connect_timeout=60) as conn:
+        process = await conn.create_process(term_type='vt100', encoding=None)
+        # Enter CLI prompt and let the menu and prompt redraws settle, so no stale prompt is left in the stream
+        process.stdin.write(b'\n \x13')
+        await _drain_async(process.stdout, params.get("last_read"), 60)
+        # learn the prompt from a bare newline, as netmiko's find_prompt does
+        process.stdin.write(b'\n')
+        buf, _ = await _read_until_async(process.stdout, _ASYNC_CLI_RE, 60)
+        prompt = _ANSI_RE.sub(b'', buf).strip().rpartition(b'\n')[2].strip()
+        # reads end on the device's own prompt or on the pager prompt
+        ssh_re = re.compile(rb'(?P<more>' + _MORE_PATTERN.encode() + rb')\s*$|' + re.escape(prompt) + rb'\s*$')
+        for command in params.get("commands"):
+            command_b = command.encode()
+            process.stdin.write(command_b + b'\n')
+            cmd_buf = bytearray()
+            while True:
+                page, match = await _read_until_async(process.stdout, ssh_re, 60)
+                cmd_buf.extend(memoryview(page)[:match.start() if match else len(page)])
+                if match is None or match.group('more') is None:
+                    break
+                process.stdin.write(b'\n')
+            # normalize line feeds, then drop the command echo and the trailing prompt, as netmiko does
+            cmd_buf = _LINEFEED_RE.sub(b'\n', cmd_buf)
+            output.extend(b'>' + command_b + b'\n')
+            output.extend(cmd_buf.partition(b'\n')[2].rpartition(b'\n')[0])
+        process.close()
+    # decode once, over the whole output
+    return output.decode('ascii', errors='replace')
+
+
+async def _run_telnet(params):
+    """Run the commands over a telnetlib3 session and return their output."""
+    timeout = params.get("telnet_timeout")
+    reader, writer = await asyncio.wait_for(
+        telnetlib3.open_connection(params.get("host"), params.get("port"), encoding=False, connect_minwait=0.1), timeout)
+    try:
+        await _read_until_async(reader, _ASYNC_USER_RE, timeout)
+        writer.write(params.get("user").encode() + b'\n')
+        await _read_until_async(reader, _ASYNC_PASSWORD_RE, timeout)
+        writer.write(params.get("password").encode() + b'\n')
+        # Enter CLI prompt
+        writer.write(b'\x13' + b'cls' + b'\n' + b'    ' + b'\n')
+        _, match = await _read_until_async(reader, _ASYNC_TELNET_RE, timeout)
+        if match is None or match.group('login'):
+            raise ConnectionError('Telnet Authentication Exception. Authentication to device failed.')
+        # send all commands and the finish keyword in a single write, then read output
+        writer.write(b''.join(command.encode() + b'\n' for command in params.get("commands")) + b'    ' + b'\n')
+        output, match = await _read_until_async(reader, _ASYNC_TELNET_RE, timeout)
+        # stop at the finish keyword, as the telnetlib path does
+        if match:
+            del output[match.end():]
+        return output.decode('ascii', errors='replace')
+    finally:
+        writer.close()
+
+
+def _fail(module, tag, err, conn_desc):
+    ret_msg = 'O4N_ERROR: ' + tag + '\nConnection settings: ' + conn_desc + '\n' + str(err)
+    module.fail_json(msg=ret_msg, failed=True, changed=False)
+
 
 def main():
     module = AnsibleModule(
@@ -103,6 +419,11 @@ def main():
             password=dict(required=True, type='str', no_log=True),
             commands=dict(required=True, type='list'),
             telnet_timeout=dict(required=False, type='int', default=10),
+            device_type=dict(required=False, type='str', default='autodetect'),
+            global_delay_factor=dict(required=False, type='float', default=1.0),
+            last_read=dict(required=False, type='float', default=1.0),
+            reuse_connection=dict(required=False, type='bool', default=False),
+            use_asyncio=dict(required=False, type='bool', default=False),
         )
     )
 
@@ -113,52 +434,81 @@ def main():
     password = module.params.get("password")
     commands = module.params.get("commands")
     telnet_timeout = module.params.get("telnet_timeout")
+    device_type = module.params.get("device_type")
+    global_delay_factor = module.params.get("global_delay_factor")
+    last_read = module.params.get("last_read")
+    conn_desc = user + '@' + host + ':' + str(port)
 
-    module_success = False
-
-    # Prevent Paramiko logs
-    logger = logging.getLogger("paramiko")
-    logger.addHandler(logging.NullHandler())
-
-    if protocol == "telnet":
-        try:
-            tn_client = telnetlib.Telnet(host=host, port=port, timeout=telnet_timeout)
-        except Exception as err:
-            ret_msg = 'O4N_ERROR: Telnet Connection Exception (a)\nConnection settings: ' + user + '@' + host + ':' + str(port) + '\n' + str(err)
+    # Validate commands before opening a session
+    if not commands:
+        module.exit_json(failed=False, content="", changed=False)
+        return()
+    for command in commands:
+        if not isinstance(command, str) or not command.strip():
+            ret_msg = 'O4N_ERROR: Invalid Command\nCommands must be non-empty strings: ' + repr(command)
             module.fail_json(msg=ret_msg, failed=True, changed=False)
             return()
-        # send user
-        try:
-            tn_client.read_until(b'Enter User Name: ', telnet_timeout)
-        except Exception as err:
-            ret_msg = 'O4N_ERROR: Telnet Connection Exception (b)\nConnection settings: ' + user + '@' + host + ':' + str(port) + '\n' + str(err)
+        if '\n' in command or '\r' in command:
+            ret_msg = 'O4N_ERROR: Invalid Command\nMulti-line commands are not supported: ' + repr(command)
             module.fail_json(msg=ret_msg, failed=True, changed=False)
             return()
-        tn_client.write(user.encode() + b'\n')
-        # send password
+
+    module_success = False
+
+    if module.params.get("use_asyncio") and (HAS_TELNETLIB3 if protocol == "telnet" else HAS_ASYNCSSH):
         try:
-            tn_client.read_until(b'Password: ', telnet_timeout)
+            output = asyncio.run(_run_telnet(module.params) if protocol == "telnet" else _run_ssh(module.params))
         except Exception as err:
-            ret_msg = 'O4N_ERROR: Telnet Connection Exception (c)\nConnection settings: ' + user + '@' + host + ':' + str(port) + '\n' + str(err)
-            module.fail_json(msg=ret_msg, failed=True, changed=False)
+            _fail(module, 'Async Telnet Exception' if protocol == "telnet" else 'Async SSH Exception', err, conn_desc)
             return()
-        tn_client.write(password.encode() + b'\n')
-        # Enter CLI prompt
-        tn_client.write(b'\x13')
-        tn_client.write(b'cls' + b'\n')
-        time.sleep(1)
+        module.exit_json(failed=False, content=output)
+        return()
+
+    if protocol == "telnet":
+        user_b = user.encode()
+        password_b = password.encode()
+        cmds_b = [command.encode() + b'\n' for command in commands]
+
+        tn_client, created_at = get_connection(module.params)
+        new_session = tn_client is None
+        if new_session:
+            try:
+                tn_client = telnetlib.Telnet(host=host, port=port, timeout=telnet_timeout)
+            except Exception as err:
+                _fail(module, 'Telnet Connection Exception (a)', err, conn_desc)
+                return()
+        # never leave the session open on failure
         try:
-            tn_client.read_very_eager()
-        except Exception as err:
-            ret_msg = 'O4N_ERROR: Telnet Connection Exception (d)\nConnection settings: ' + user + '@' + host + ':' + str(port) + '\n' + str(err)
-            module.fail_json(msg=ret_msg, failed=True, changed=False)
-            return()
-        tn_client.write(b'\n')
+            if new_session:
+                # send user
+                try:
+                    tn_client.read_until(b'Enter User Name: ', telnet_timeout)
+                except Exception as err:
+                    _fail(module, 'Telnet Connection Exception (b)', err, conn_desc)
+                    return()
+                tn_client.write(user_b + b'\n')
+                # send password
+                try:
+                    tn_client.read_until(b'Password: ', telnet_timeout)
+                except Exception as err:
+                    _fail(module, 'Telnet Connection Exception (c)', err, conn_desc)
+                    return()
+                tn_client.write(password_b + b'\n')
+                # Enter CLI prompt
+                tn_client.write(b'\x13')
+                tn_client.write(b'cls' + b'\n')
+                # finish keyword marks when the screen is cleared
+                tn_client.write(b'    ' + b'\n')
+                try:
+                    prompt = _wait_prompt(tn_client, telnet_timeout)
+                    tn_client.read_very_eager()
+                except Exception as err:
+                    _fail(module, 'Telnet Connection Exception (d)', err, conn_desc)
+                    return()
 
-        # Check Authentication
-        prompt = tn_client.read_until(b'>    ', telnet_timeout)
-        if 'Enter User Name:' in prompt.decode('ascii'):
-            ret_msg = """
+                # Check Authentication, a failed login shows the user prompt again instead of the CLI prompt
+                if 'Enter User Name:' in prompt.decode('ascii', errors='replace') or not _PROMPT_RE.search(prompt):
+                    ret_msg = """
 'O4N_ERROR: Telnet Authentication Exception.\n
 Authentication to device failed.\n
 Common causes of this problem are:\n
@@ -166,24 +516,23 @@ Common causes of this problem are:\n
 2. Connecting to the wrong device\n
 Connection settings:
 """
-            module.fail_json(msg=ret_msg + user + '@' + host + ':' + str(port), failed=True, changed=False)
-            return()
+                    module.fail_json(msg=ret_msg + conn_desc, failed=True, changed=False)
+                    return()
 
-        for command in commands:
-            time.sleep(0.2)
-            tn_client.write(command.encode() + b'\n')
+            # send all commands and the finish keyword in a single write, then read output
+            try:
+                tn_client.write(b''.join(cmds_b) + b'    ' + b'\n')
+                output = _wait_prompt(tn_client, telnet_timeout)
+            except Exception as err:
+                _fail(module, 'Telnet Command Exception', err, conn_desc)
+                return()
+            output = output.decode('ascii', errors='replace')
+        except BaseException:
+            _close(tn_client, protocol)
+            raise
 
-        # send finish keyword and read output
-        tn_client.write(b'    '+b'\n')
-        try:
-            output = tn_client.read_until(b'>    ', telnet_timeout)
-        except Exception as err:
-            ret_msg = 'O4N_ERROR: Telnet Command Exception \n' + str(err)
-            module.fail_json(msg=ret_msg, failed=True, changed=False)
-            return()
-        output = output.decode('ascii')
-        # close session
-        tn_client.close()
+        # close session, or keep it pooled for the next task
+        release(module.params, tn_client, created_at)
 
         module_success = True
         # Module return
@@ -193,48 +542,61 @@ Connection settings:
             module.fail_json(msg='O4N_ERROR: Module Failed\n', failed=True, changed=False)
 
     else:
-        try:
-            ssh_client = ConnectHandler(host, device_type='autodetect', username=user, port=port, password=password, auth_timeout=90, timeout=60)
-        except Exception as err:
-            ret_msg = 'O4N_ERROR: SSH Connection Exception\n' + str(err)
-            module.fail_json(msg=ret_msg, failed=True, changed=False)
-            return()
-        try:
-            ssh_client.send_command_timing('\n \x13', last_read=1)
-        except Exception as err:
-            ret_msg = 'O4N_ERROR: CLI Prompt Exception\n' + str(err)
-            module.fail_json(msg=ret_msg, failed=True, changed=False)
-            return()
-        output = ""
-        for command in commands:
-            # Aux Vars:
-            more_prompt = "--More-- or (q)uit"
-            cmd_output = '>' + command + '\n'
-            # Execute command:
+        ssh_client, created_at = get_connection(module.params)
+        new_session = ssh_client is None
+        if new_session:
             try:
-                page = ssh_client.send_command_timing(command, last_read=1)
+                ssh_client = ConnectHandler(device_type=device_type, host=host, username=user, port=port, password=password,
+                                            auth_timeout=90, timeout=60, global_delay_factor=global_delay_factor)
             except Exception as err:
-                ret_msg = 'O4N_ERROR: Send Command Exception\n' + str(err)
-                module.fail_json(msg=ret_msg, failed=True, changed=False)
+                _fail(module, 'SSH Connection Exception', err, conn_desc)
                 return()
-            while True:
+        # never leave the session open on failure
+        try:
+            # Enter CLI prompt, no netmiko driver leaves the ROS menu on its own
+            if new_session:
                 try:
-                    cmd_output += page
-                    if more_prompt in page:
-                        try:
-                            page = ssh_client.send_command_timing('\n', last_read=1)
-                        except Exception as err:
-                            ret_msg = 'O4N_ERROR: Pagination Exception\n' + str(err)
-                            module.fail_json(msg=ret_msg, failed=True, changed=False)
-                            return()
-                    else:
-                        break
-                except NetmikoTimeoutException:
-                    print("Time Out Exeption")
-                    break
-            output += cmd_output.replace(more_prompt, "")
+                    ssh_client.send_command_timing('\n \x13', last_read=last_read)
+                    ssh_client.set_base_prompt(pri_prompt_terminator='>', alt_prompt_terminator='>')
+                except Exception as err:
+                    _fail(module, 'CLI Prompt Exception', err, conn_desc)
+                    return()
+            # reads end on the device's own prompt or on the pager prompt
+            ssh_expect = re.escape(ssh_client.base_prompt) + r'>\s*$|' + _MORE_PATTERN
+            trailing_prompt = re.compile(r'\n?' + re.escape(ssh_client.base_prompt) + r'>\s*$')
+            # every page goes straight into one list, joined once at the end
+            output_parts = []
+            for command in commands:
+                output_parts.extend(('>', command, '\n'))
+                # Execute command:
+                try:
+                    page = ssh_client.send_command(command, expect_string=ssh_expect, read_timeout=30,
+                                                   strip_command=True, strip_prompt=True)
+                except Exception as err:
+                    _fail(module, 'Send Command Exception', err, conn_desc)
+                    return()
+                # the pager prompt is only ever printed at the end of a page
+                more = _MORE_RE.search(page, max(0, len(page) - 64))
+                while more:
+                    output_parts.append(page[:more.start()])
+                    try:
+                        # keep every line: the first one of a continuation page is data, not an echo
+                        page = ssh_client.send_command('\n', expect_string=ssh_expect, read_timeout=30,
+                                                       strip_command=False, strip_prompt=False)
+                    except Exception as err:
+                        _fail(module, 'Pagination Exception', err, conn_desc)
+                        return()
+                    more = _MORE_RE.search(page, max(0, len(page) - 64))
+                    if not more:
+                        page = trailing_prompt.sub('', page)
+                output_parts.append(page)
+            output = "".join(output_parts)
+        except BaseException:
+            _close(ssh_client, protocol)
+            raise
 
-        ssh_client.disconnect()
+        # close session, or keep it pooled for the next task
+        release(module.params, ssh_client, created_at)
 
         # Module return
         module_success = True